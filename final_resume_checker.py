@@ -3,9 +3,17 @@
 import streamlit as st
 import fitz  # PyMuPDF
 import docx2txt
+import io
 import re
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from spellchecker import SpellChecker
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import re2 as re_engine  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    re_engine = re
 
 SECTION_KEYWORDS = {
     "experience": ["experience", "work history", "employment", "professional experience"],
@@ -32,46 +40,55 @@ BUZZWORDS = [
 
 PRO_EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "hotmail.com"]
 
-def extract_text_from_file(uploaded_file):
-    if uploaded_file.name.endswith(".txt"):
-        return uploaded_file.read().decode("utf-8"), 1
-    elif uploaded_file.name.endswith(".pdf"):
-        text = ""
-        with fitz.open(stream=uploaded_file.read(), filetype="pdf") as doc:
-            for page in doc:
-                text += page.get_text()
-            return text, len(doc)
-    elif uploaded_file.name.endswith((".doc", ".docx")):
-        return docx2txt.process(uploaded_file), 1
+# PyMuPDF's default text flags minus ligature preservation, so ligatures come
+# out as ordinary letters for the regex and spell-check passes.
+PDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+EMAIL_RE = re_engine.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+PHONE_RE = re_engine.compile(r"\+?\d[\d\s\-]{8,}\d")
+LINKEDIN_RE = re_engine.compile(r"(https?:\/\/)?(www\.)?linkedin\.com\/in\/[a-zA-Z0-9\-_]+")
+WORD_RE = re.compile(r"\b\w+\b")
+EXPERIENCE_RES = [
+    re.compile(r"(\d+)\s*years?\s*(of)?\s*experience"),
+    re.compile(r"(\d+)\+\s*years?"),
+]
+
+def extract_text_from_file(name, data):
+    if name.endswith(".txt"):
+        return data.decode("utf-8"), 1
+    elif name.endswith(".pdf"):
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            text = "".join(page.get_text("text", flags=PDF_TEXT_FLAGS) for page in doc)
+            return text, doc.page_count
+    elif name.endswith((".doc", ".docx")):
+        return docx2txt.process(io.BytesIO(data)), 1
     return "", 0
 
-def find_sections(text):
-    found = {}
-    text = text.lower()
-    for section, keywords in SECTION_KEYWORDS.items():
-        found[section] = any(k in text for k in keywords)
-    return found
-
-def detect_experience_years(text):
-    patterns = [
-        r'(\d+)\s*years?\s*(of)?\s*experience',
-        r'(\d+)\+\s*years?'
-    ]
-    max_years = 0
-    for pattern in patterns:
-        matches = re.findall(pattern, text.lower())
-        for match in matches:
-            if isinstance(match, tuple):
-                match = match[0]
-            try:
-                max_years = max(max_years, int(match))
-            except:
-                pass
-    return max_years
+def tokenize(text_lc):
+    return frozenset(WORD_RE.findall(text_lc))
+
+def find_sections(text, text_lc=None):
+    if text_lc is None:
+        text_lc = text.lower()
+    return {
+        section: any(k in text_lc for k in keywords)
+        for section, keywords in SECTION_KEYWORDS.items()
+    }
+
+def detect_experience_years(text, text_lc=None):
+    if text_lc is None:
+        text_lc = text.lower()
+    return max(
+        (int(match.group(1)) for pattern in EXPERIENCE_RES for match in pattern.finditer(text_lc)),
+        default=0,
+    )
 
 def extract_email_and_phone(text):
-    email = re.search(r"[\w\.-]+@[\w\.-]+\.\w+", text)
-    phone = re.search(r"\+?\d[\d\s\-]{8,}\d", text)
+    email = EMAIL_RE.search(text) if "@" in text else None
+    phone = PHONE_RE.search(text)
+    # Digits inside the address are not a phone number; look past it instead.
+    if email and phone and email.start() <= phone.start() < email.end():
+        phone = PHONE_RE.search(text, email.end())
     return email.group(0) if email else None, phone.group(0) if phone else None
 
 def is_professional_email(email):
@@ -80,22 +97,32 @@ def is_professional_email(email):
         return domain not in PRO_EMAIL_DOMAINS
     return False
 
-def has_linkedin(text):
-    return bool(re.search(r"(https?:\/\/)?(www\.)?linkedin\.com\/in\/[a-zA-Z0-9\-_]+", text.lower()))
-
-def count_spelling_errors(text):
-    spell = SpellChecker()
-    words = re.findall(r'\b\w+\b', text.lower())
-    misspelled = spell.unknown(words)
+def has_linkedin(text, text_lc=None):
+    if text_lc is None:
+        text_lc = text.lower()
+    return "linkedin.com/" in text_lc and bool(LINKEDIN_RE.search(text_lc))
+
+@st.cache_resource
+def get_spell_checker():
+    return SpellChecker()
+
+def count_spelling_errors(text, text_lc=None, tokens=None):
+    if text_lc is None:
+        text_lc = text.lower()
+    if tokens is None:
+        tokens = tokenize(text_lc)
+    spell = get_spell_checker()
+    misspelled = spell.unknown(tokens)
     return len(misspelled), list(misspelled)
 
 def check_resume_length(text):
     words = text.split()
     return len(words)
 
-def detect_buzzwords(text):
-    found = [word for word in BUZZWORDS if word in text.lower()]
-    return found
+def detect_buzzwords(text, text_lc=None):
+    if text_lc is None:
+        text_lc = text.lower()
+    return [word for word in BUZZWORDS if word in text_lc]
 
 def calculate_score(sections, email, phone, professional_email, linkedin, spelling_errors, pages):
     score = 0
@@ -107,48 +134,89 @@ def calculate_score(sections, email, phone, professional_email, linkedin, spelli
     if pages <= 2: score += 10
     return min(score, 100)
 
+# Keyed on the upload bytes, so reruns on the same resume skip all analysis.
+@st.cache_data(show_spinner=False)
+def analyze_resume(name, data):
+    text, pages = extract_text_from_file(name, data)
+    text_lc = text.lower()
+    tokens = tokenize(text_lc)
+    sections = find_sections(text, text_lc)
+    email, phone = extract_email_and_phone(text)
+    professional_email = is_professional_email(email)
+    linkedin = has_linkedin(text, text_lc)
+    spelling_errors, misspelled_words = count_spelling_errors(text, text_lc, tokens)
+    return {
+        "name": name,
+        "score": calculate_score(sections, email, phone, professional_email, linkedin, spelling_errors, pages),
+        "sections": sections,
+        "email": email,
+        "phone": phone,
+        "professional_email": professional_email,
+        "linkedin": linkedin,
+        "exp_years": detect_experience_years(text, text_lc),
+        "spelling_errors": spelling_errors,
+        "misspelled_words": misspelled_words,
+        "word_count": check_resume_length(text),
+        "pages": pages,
+        "buzzwords_found": detect_buzzwords(text, text_lc),
+    }
+
+def render_report(report):
+    st.header(f"📊 Resume Analysis Report: {report['name']}")
+    st.markdown(f"**✅ Completeness Score:** {report['score']}/100")
+
+    with st.expander("📂 Section Presence"):
+        for sec, found in report["sections"].items():
+            st.write(f"{'✓' if found else '✗'} {sec.title()}")
+
+    with st.expander("📧 Contact Info"):
+        st.write(f"**Email:** {report['email'] or 'Not found'}")
+        st.write(f"**Phone:** {report['phone'] or 'Not found'}")
+        st.write(f"**Professional Email:** {'Yes' if report['professional_email'] else 'No'}")
+        st.write(f"**LinkedIn:** {'✓' if report['linkedin'] else '✗'}")
+
+    with st.expander("📈 Experience"):
+        st.write(f"**Years of Experience Detected:** {report['exp_years']} years")
+
+    with st.expander("🔍 Spell Check"):
+        st.write(f"**Spelling Errors:** {report['spelling_errors']}")
+        if report["misspelled_words"]:
+            st.write(f"**Misspelled Words:** {', '.join(report['misspelled_words'][:10])}...")
+
+    with st.expander("📏 Length & Keywords"):
+        buzzwords_found = report["buzzwords_found"]
+        st.write(f"**Total Words:** {report['word_count']}")
+        st.write(f"**Total Pages:** {report['pages']}")
+        st.write(f"**Buzzwords Found:** {', '.join(buzzwords_found) if buzzwords_found else 'None'}")
+
 def main():
     st.set_page_config(page_title="Resume Quality Checker", layout="centered")
     st.title("💼 Advanced Resume Quality Checker")
-    uploaded_file = st.file_uploader("Upload Resume", type=["txt", "pdf", "doc", "docx"])
-
-    if uploaded_file:
-        text, pages = extract_text_from_file(uploaded_file)
-        sections = find_sections(text)
-        email, phone = extract_email_and_phone(text)
-        professional_email = is_professional_email(email)
-        linkedin = has_linkedin(text)
-        exp_years = detect_experience_years(text)
-        spelling_errors, misspelled_words = count_spelling_errors(text)
-        word_count = check_resume_length(text)
-        buzzwords_found = detect_buzzwords(text)
-        score = calculate_score(sections, email, phone, professional_email, linkedin, spelling_errors, pages)
-
-        st.header("📊 Resume Analysis Report")
-        st.markdown(f"**✅ Completeness Score:** {score}/100")
-
-        with st.expander("📂 Section Presence"):
-            for sec, found in sections.items():
-                st.write(f"{'✓' if found else '✗'} {sec.title()}")
-
-        with st.expander("📧 Contact Info"):
-            st.write(f"**Email:** {email or 'Not found'}")
-            st.write(f"**Phone:** {phone or 'Not found'}")
-            st.write(f"**Professional Email:** {'Yes' if professional_email else 'No'}")
-            st.write(f"**LinkedIn:** {'✓' if linkedin else '✗'}")
-
-        with st.expander("📈 Experience"):
-            st.write(f"**Years of Experience Detected:** {exp_years} years")
-
-        with st.expander("🔍 Spell Check"):
-            st.write(f"**Spelling Errors:** {spelling_errors}")
-            if misspelled_words:
-                st.write(f"**Misspelled Words:** {', '.join(misspelled_words[:10])}...")
-
-        with st.expander("📏 Length & Keywords"):
-            st.write(f"**Total Words:** {word_count}")
-            st.write(f"**Total Pages:** {pages}")
-            st.write(f"**Buzzwords Found:** {', '.join(buzzwords_found) if buzzwords_found else 'None'}")
+    uploaded_files = st.file_uploader(
+        "Upload Resumes", type=["txt", "pdf", "doc", "docx"], accept_multiple_files=True
+    )
+
+    if uploaded_files:
+        # Worker threads need the script context to use st.cache_*.
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(uploaded_files)),
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx),
+        ) as executor:
+            futures = [
+                (f.name, executor.submit(analyze_resume, f.name, f.getvalue()))
+                for f in uploaded_files
+            ]
+
+        # One unreadable file must not hide the reports for the rest of the batch.
+        for name, future in futures:
+            try:
+                report = future.result()
+            except Exception as e:
+                st.error(f"Could not analyze {name}: {e}")
+                continue
+            render_report(report)
 
 if __name__ == '__main__':
     main()